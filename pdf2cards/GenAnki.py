@@ -1,8 +1,26 @@
 from aqt import mw
 from datetime import datetime
+import os
 
 
-def writeCards(cards, deck):
+def addMedia(name, data, index):
+    folder = mw.col.media.dir()
+    digest = os.path.splitext(name)[0]
+    existing = index.lookup(folder, digest)
+    if existing is not None:
+        return existing
+    new_filename = mw.col.media.write_data(name, data)
+    index.add(folder, digest, new_filename)
+    return new_filename
+
+
+def field(side, index):
+    if isinstance(side, str):
+        return side
+    return f'<img src="{addMedia(*side, index)}">'
+
+
+def writeCards(cards, deck, index):
     today = datetime.today().strftime("%Y_%M_%d")
 
     basic = mw.col.models.byName("Basic")
@@ -15,10 +33,9 @@ def writeCards(cards, deck):
         mw.col.models.setCurrent(basic)
         note = mw.col.newNote(False)
 
-        new_filename = mw.col.media.add_file(question)
-        note["Front"] = f'<img src="{new_filename}">'
-
-        new_filename = mw.col.media.add_file(answer)
-        note["Back"] = f'<img src="{new_filename}">'
+        note["Front"] = field(question, index)
+        note["Back"] = field(answer, index)
 
         mw.col.add_note(note, deck.id)
+
+    index.save()
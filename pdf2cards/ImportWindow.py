@@ -2,31 +2,69 @@ from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
 from .GraphicsRectItem import GraphicsRectItem
+from .cache import MediaIndex, PageCache
+from .codec import PRESETS
+from .imaging import detect_grid
+from .pagestore import PageStore
+from .structure import grid_bounds
 from .worker import Worker
 from aqt import mw
+from aqt.utils import tooltip
+import os
 
 
 class ImportWindow(QDialog):
+    requestOpen = pyqtSignal(str)
+    requestPage = pyqtSignal(int)
+    requestPrefetch = pyqtSignal(int)
+    requestSections = pyqtSignal(int)
+    requestSave = pyqtSignal(str, object, object, str)
+    requestClose = pyqtSignal()
+
     def __init__(self, parent=None, filename=None):
         self.filename = filename
-        self.tempdir = QTemporaryDir()
-        assert self.tempdir.isValid(), "Temporary Directory is invalid!"
         self.rows = 4
         self.columns = 2
         self.current_page = 0
+        self.page_count = 0
         self.questions = ()
         self.decks = mw.col.decks.all_names_and_ids()
         super(ImportWindow, self).__init__(parent)
 
-        self.pixmaps = []
+        config = mw.addonManager.getConfig(__name__)
+        self.codec = config["codec"]
+        self.auto_detect = config["auto_detect_grid"]
+        self.pages = PageStore(config["preview_memory_mb"] * 2 ** 20)
+        self.requested = set()
+        self.structures = {}
+        self.requested_structures = set()
+        self.detected = set()
         self.size = QSize(870, 1100)
-        self.work = Worker()
+        user_files = os.path.join(os.path.dirname(__file__), "user_files")
+        cache = PageCache(os.path.join(user_files, "cache"), config["cache_size_mb"] * 2 ** 20)
+        media_index = MediaIndex(os.path.join(user_files, "media_index.json"))
+        self.work = Worker(cache, media_index, self.size, encoders=config["encode_threads"],
+                           target={"ssim": config["target_ssim"], "steps": config["target_steps"]},
+                           trim_padding=config["trim_padding"] if config["trim_whitespace"] else None,
+                           skip_blank=config["skip_blank"])
         self.thread = QThread()
         self.work.moveToThread(self.thread)
-        self.work.converted.connect(self.pdfConverted)
-        self.thread.started.connect(lambda: self.work.convertPdf(filename, self.tempdir.path(), self.size))
+        self.work.opened.connect(self.pdfOpened)
+        self.work.pageReady.connect(self.pageReady)
+        self.work.pageFailed.connect(self.pageFailed)
+        self.work.sectionsReady.connect(self.sectionsReady)
+        self.work.progress.connect(self.pdfProgress)
+        self.work.saved.connect(self.saved)
+        self.work.saveFailed.connect(self.saveFailed)
+        self.requestOpen.connect(self.work.openPdf)
+        self.requestPage.connect(self.work.renderPage, Qt.DirectConnection)
+        self.requestPrefetch.connect(self.work.prefetchPage, Qt.DirectConnection)
+        self.requestSave.connect(self.work.saveCards)
+        self.requestSections.connect(self.work.findSections)
+        self.requestClose.connect(self.work.finish)
         self.setCursor(Qt.WaitCursor)
         self.thread.start()
+        self.requestOpen.emit(filename)
 
         self.initGUI()
 
@@ -39,6 +77,7 @@ class ImportWindow(QDialog):
 
         self.rect = GraphicsRectItem(87, 110, 696, 880, handleSize=50, rows=self.rows, columns=self.columns)
         self.scene.addItem(self.rect)
+        self.placed = self.gridState()
 
         self.view = QGraphicsView(self.scene)
         self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -67,11 +106,19 @@ class ImportWindow(QDialog):
         self.combobox = QComboBox()
         self.combobox.addItems([str(deck.name) for deck in self.decks])
 
+        self.combobox_codec = QComboBox()
+        self.combobox_codec.addItems(list(PRESETS))
+        self.combobox_codec.setCurrentText(self.codec)
+
         self.button_save = QPushButton()
         self.button_save.clicked.connect(self.save)
         self.button_save.setText("Save")
         self.button_save.setEnabled(False)
 
+        self.button_detect = QPushButton()
+        self.button_detect.clicked.connect(self.detectGrid)
+        self.button_detect.setText("Detect Grid")
+
         self.button_undo = QPushButton()
         self.button_undo.clicked.connect(self.undo)
         self.button_undo.setText("Undo")
@@ -99,6 +146,7 @@ class ImportWindow(QDialog):
         layout_bottom.addWidget((QLabel("Columns")), 2, 0)
         layout_bottom.addWidget(self.spinbox_row, 1, 1)
         layout_bottom.addWidget(self.spinbox_column, 2, 1)
+        layout_bottom.addWidget(self.button_detect, 0, 0)
         layout_bottom.setColumnStretch(2, 1)
         label = QLabel("Add to Deck:")
         label.setAlignment(Qt.AlignRight)
@@ -107,6 +155,10 @@ class ImportWindow(QDialog):
         layout_bottom.addWidget(self.button_save, 1, 3)
         layout_bottom.addWidget(self.button_undo, 1, 4)
         layout_bottom.addWidget(self.button_close, 2, 4)
+        label = QLabel("Image Format:")
+        label.setAlignment(Qt.AlignRight)
+        layout_bottom.addWidget(label, 3, 1, 1, 2)
+        layout_bottom.addWidget(self.combobox_codec, 3, 3, 1, 2)
 
         self.setLayout(layout_main)
         self.setWindowTitle("Import Cards from PDF")
@@ -120,19 +172,91 @@ class ImportWindow(QDialog):
 
     def pagechange(self, i):
         if i < 0:
-            i = len(self.pixmaps)-1
-        elif i >= len(self.pixmaps):
+            i = self.page_count - 1
+        elif i >= self.page_count:
             i = 0
         self.current_page = i
         self.spinbox_page.setValue(i+1)
-        try:
-            self.pixmap.setPixmap(self.pixmaps[i])
-        except IndexError:
-            pass
+        for page in (i, i + 1):
+            self.fetch(page)
+        self.requestPrefetch.emit(i)
+        if i not in self.structures and i not in self.requested_structures:
+            self.requested_structures.add(i)
+            self.requestSections.emit(i)
+        if i in self.pages:
+            self.showPage(i)
+
+    def showPage(self, i):
+        pixmap = self.pages.pixmap(i)
+        self.pixmap.setPixmap(pixmap)
+        rect = QRectF(pixmap.rect())
+        if rect != self.scene.sceneRect():
+            self.scene.setSceneRect(rect)
+            self.view.fitInView(rect, Qt.KeepAspectRatio)
+            if not self.questions and not rect.contains(self.rect.rect().translated(self.rect.pos())):
+                self.rect.setPos(0, 0)
+                self.rect.setRect(rect.adjusted(rect.width() / 10, rect.height() / 10,
+                                                -rect.width() / 10, -rect.height() / 10))
+                self.rect.updateHandlesPos()
+                self.placed = self.gridState()
+        if i not in self.detected and self.autoDetect():
+            self.detected.add(i)
+            self.detectGrid()
+
+    def gridState(self):
+        return self.rect.rect().translated(self.rect.pos()).getCoords(), self.rect.rows, self.rect.columns
+
+    def autoDetect(self):
+        """
+        Whether the grid may be placed automatically: only while choosing
+        questions and as long as the user has not adjusted it by hand.
+        """
+        return self.auto_detect and not self.questions and self.gridState() == self.placed
+
+    def detectGrid(self):
+        # the answer grid has to keep the shape of the chosen question grid
+        if self.questions or self.current_page not in self.pages:
+            return
+        sections = self.structures.get(self.current_page)
+        if sections is not None:
+            grid = grid_bounds(sections)
+        else:
+            grid = detect_grid(self.pages.image(self.current_page))
+        if grid is None:
+            return
+        (x0, y0, x1, y1), rows, columns = grid
+        rect = self.scene.sceneRect()
+        self.rect.setPos(0, 0)
+        self.rect.setRect(QRectF(x0 * rect.width(), y0 * rect.height(),
+                                 (x1 - x0) * rect.width(), (y1 - y0) * rect.height()))
+        self.rect.updateHandlesPos()
+        self.spinbox_row.setValue(rows)
+        self.spinbox_column.setValue(columns)
+        self.placed = self.gridState()
+
+    def sections(self):
+        """
+        The exact slide boxes of an n-up page while the grid still sits on them,
+        otherwise the even split of the grid rectangle.
+        """
+        sections = self.structures.get(self.current_page)
+        if sections is not None:
+            (x0, y0, x1, y1), rows, columns = grid_bounds(sections)
+            scene = self.scene.sceneRect()
+            exact = (x0 * scene.width(), y0 * scene.height(), x1 * scene.width(), y1 * scene.height())
+            rect = self.rect.rect().translated(self.rect.pos()).getCoords()
+            placed = all(abs(a - b) <= 1 for a, b in zip(rect, exact))
+            if placed and (rows, columns) == (self.rect.rows, self.rect.columns):
+                return sections
+        return self.rect.getSections()
+
+    def fetch(self, i):
+        if 0 <= i < self.page_count and i not in self.pages and i not in self.requested:
+            self.requested.add(i)
+            self.requestPage.emit(i)
 
     def save(self):
-        data = (self.current_page, self.rect.getSections())
-        self.pagechange(self.current_page + 1)
+        data = (self.current_page, self.sections())
         try:
             deck = next(filter(lambda i: i.name == self.combobox.currentText(), self.decks))
         except StopIteration:
@@ -142,47 +266,85 @@ class ImportWindow(QDialog):
             self.info.setText("Choose Answers for selected Questions")
             self.spinbox_row.setEnabled(False)
             self.spinbox_column.setEnabled(False)
+            self.button_detect.setEnabled(False)
             self.combobox.setEnabled(False)
             self.button_undo.setEnabled(True)
         else:
             self.button_save.setEnabled(False)
             self.button_save.setCursor(Qt.WaitCursor)
 
-            self.work.saved.connect(self.saved)
             data = (self.questions, data)
-            self.thread.started.connect(lambda: self.work.saveCards(self.filename, data, deck))
-            self.thread.start()
+            self.requestSave.emit(self.filename, data, deck, self.combobox_codec.currentText())
 
             self.questions = ()
             self.info.setText("Choose Questions")
             self.spinbox_row.setEnabled(True)
             self.spinbox_column.setEnabled(True)
+            self.button_detect.setEnabled(True)
             self.combobox.setEnabled(True)
             self.button_undo.setEnabled(False)
+        self.pagechange(self.current_page + 1)
 
     def undo(self):
         self.questions = ()
         self.info.setText("Choose Questions")
         self.spinbox_row.setEnabled(True)
         self.spinbox_column.setEnabled(True)
+        self.button_detect.setEnabled(True)
         self.combobox.setEnabled(True)
         self.button_undo.setEnabled(False)
 
-    def pdfConverted(self, data):
-        self.pixmaps = data
-        self.thread.quit()
-        self.thread.wait()
-        self.thread.started.disconnect()
-        self.pixmap.setPixmap(self.pixmaps[self.current_page])
+    def pdfOpened(self, page_count):
+        self.page_count = page_count
+        self.spinbox_page.setRange(1, page_count)
+        self.pagechange(self.current_page)
         self.button_save.setEnabled(True)
-        self.setCursor(Qt.ArrowCursor)
 
-    def saved(self):
-        self.thread.quit()
-        self.thread.wait()
-        try:
-            self.thread.started.disconnect()
-        except TypeError:
-            pass
+    def pageReady(self, i, page):
+        self.requested.discard(i)
+        self.pages.put(i, page, self.current_page)
+        if i == self.current_page:
+            self.showPage(i)
+            self.setCursor(Qt.ArrowCursor)
+
+    def pageFailed(self, i, message):
+        self.requested.discard(i)
+        if i == self.current_page:
+            self.pixmap.setPixmap(QPixmap())
+            self.setCursor(Qt.ArrowCursor)
+            tooltip(f"Page {i + 1} could not be rendered:<br>{message}", parent=self)
+
+    def sectionsReady(self, i, sections):
+        self.requested_structures.discard(i)
+        self.structures[i] = sections
+        # replaces an automatic placement from the page image, never a hand-adjusted grid
+        if sections is not None and i == self.current_page and i in self.pages and self.autoDetect():
+            self.detected.add(i)
+            self.detectGrid()
+
+    def pdfProgress(self, done, total):
+        if done < total:
+            self.setWindowTitle(f"Import Cards from PDF ({done}/{total})")
+        else:
+            self.setWindowTitle("Import Cards from PDF")
+
+    def saved(self, report, skipped):
+        self.button_save.setEnabled(True)
+        self.button_save.setCursor(Qt.ArrowCursor)
+        lines = [f"{name}: {count} {'fields' if name == 'Text' else 'images'}, {total / 1024:.0f} KB"
+                 for name, (count, total) in sorted(report.items())]
+        if skipped:
+            lines.append(f"Skipped {skipped} blank cells")
+        tooltip("<br>".join(lines), parent=self)
+
+    def saveFailed(self, message):
         self.button_save.setEnabled(True)
         self.button_save.setCursor(Qt.ArrowCursor)
+        tooltip(f"Cards could not be saved:<br>{message}", parent=self)
+
+    def done(self, r):
+        # queued behind any pending save, so those cards are still written
+        self.requestClose.emit()
+        self.thread.wait()
+        self.work.close()
+        super(ImportWindow, self).done(r)
@@ -308,6 +308,7 @@ def _build_command(
     single_file,
     grayscale,
     size,
+    region=None,
 ):
     if use_cropbox:
         args.append("-cropbox")
@@ -357,6 +358,10 @@ def _build_command(
     else:
         raise ValueError("Size {} is not a tuple or an integer")
 
+    if region is not None:
+        x, y, width, height = region
+        args.extend(["-x", str(int(x)), "-y", str(int(y)), "-W", str(int(width)), "-H", str(int(height))])
+
     return args
 
 
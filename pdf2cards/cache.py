@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+from .document import per_document
+from .rasterizer import ppm_frames
+
+
+def file_digest(path, chunk_size=2 ** 20):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@per_document(64)
+def document_digest(path):
+    """
+    file_digest of a PDF, cached per document so reopening it doesn't hash it again.
+    """
+    return file_digest(path)
+
+
+class PageCache:
+    """
+    Rendered pages on disk, shared across sessions and evicted least recently used first.
+    """
+
+    def __init__(self, folder, max_bytes):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.total = 0
+        os.makedirs(folder, exist_ok=True)
+        files = []
+        for name in os.listdir(folder):
+            if name.endswith(".tmp"):
+                continue
+            st = os.stat(os.path.join(folder, name))
+            files.append((st.st_mtime, name, st.st_size))
+        for _, name, size in sorted(files):
+            self.entries[name] = size
+            self.total += size
+
+    @staticmethod
+    def key(digest, page, resolution, backend):
+        return hashlib.sha1(f"{digest}:{page}:{resolution}:{backend}".encode()).hexdigest()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+        path = os.path.join(self.folder, key)
+        try:
+            with open(path, "rb") as f:
+                data = zlib.decompress(f.read())
+            os.utime(path)
+        except (OSError, zlib.error):
+            self.discard(key)
+            return None
+        return ppm_frames(data)[0]
+
+    def put(self, key, frame):
+        data = b"P6\n%d %d\n255\n" % (frame.width, frame.height) + bytes(frame.data)
+        data = zlib.compress(data, 1)
+        path = os.path.join(self.folder, key)
+        temp = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp, "wb") as f:
+                f.write(data)
+            os.replace(temp, path)
+        except OSError:
+            return
+        with self.lock:
+            self.total += len(data) - self.entries.pop(key, 0)
+            self.entries[key] = len(data)
+            while self.total > self.max_bytes and len(self.entries) > 1:
+                name, size = self.entries.popitem(last=False)
+                self.total -= size
+                try:
+                    os.remove(os.path.join(self.folder, name))
+                except OSError:
+                    pass
+
+    def discard(self, key):
+        with self.lock:
+            self.total -= self.entries.pop(key, 0)
+        try:
+            os.remove(os.path.join(self.folder, key))
+        except OSError:
+            pass
+
+
+class MediaIndex:
+    """
+    Persistent map from content hash to file name of the media this add-on stored, per media folder.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path, encoding="utf8") as f:
+                self.folders = json.load(f)
+        except (OSError, ValueError):
+            self.folders = {}
+
+    def lookup(self, folder, digest):
+        with self.lock:
+            name = self.folders.get(folder, {}).get(digest)
+        if name is not None and os.path.exists(os.path.join(folder, name)):
+            return name
+        return None
+
+    def add(self, folder, digest, name):
+        with self.lock:
+            self.folders.setdefault(folder, {})[digest] = name
+
+    def save(self):
+        with self.lock:
+            data = json.dumps(self.folders)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp = f"{self.path}.tmp"
+        with open(temp, "w", encoding="utf8") as f:
+            f.write(data)
+        os.replace(temp, self.path)
@@ -0,0 +1,136 @@
+from collections import OrderedDict, namedtuple
+from io import BytesIO
+
+from PIL import Image, ImageFilter, ImageMath, ImageStat, features
+
+Codec = namedtuple("Codec", ["name", "format", "extension", "options"])
+
+PRESETS = OrderedDict()
+PRESETS["JPEG"] = Codec("JPEG", "JPEG", "jpg", {"quality": 85, "optimize": True, "progressive": True})
+if features.check("webp"):
+    PRESETS["WebP"] = Codec("WebP", "WEBP", "webp", {"quality": 80, "method": 4})
+    PRESETS["WebP lossless"] = Codec("WebP lossless", "WEBP", "webp", {"lossless": True, "quality": 80, "method": 4})
+PRESETS["PNG"] = Codec("PNG", "PNG", "png", {"optimize": True})
+PRESETS["Auto"] = Codec("Auto", None, None, {})
+PRESETS["Target quality"] = Codec("Target quality", None, None, {"ssim": 0.985, "steps": 5})
+# not an image format: cells become HTML from the PDF text layer, images are only used where there is no text
+PRESETS["Text"] = Codec("Text", None, None, {})
+
+PALETTE_PNG = Codec("PNG palette", "PNG", "png", {"optimize": True})
+
+# share of near-white pixels above which a cell is treated as text on a light background
+LIGHT_RATIO = 0.5
+# mean edge strength (0-1) above which a cell is treated as line art rather than a photo
+EDGE_DENSITY = 0.12
+
+
+# SSIM stabilizing constants for 8-bit data
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+
+
+def get_codec(name):
+    return PRESETS.get(name, PRESETS["JPEG"])
+
+
+def classify(image):
+    """
+    Cheap content class of a cell: "flat" (at most 256 colors), "text" or "photo".
+    """
+    if image.getcolors(256) is not None:
+        return "flat"
+    thumb = image.convert("L")
+    if min(thumb.size) >= 64:
+        thumb = thumb.reduce(4)
+    histogram = thumb.histogram()
+    light = sum(histogram[224:]) / max(1, thumb.width * thumb.height)
+    edges = ImageStat.Stat(thumb.filter(ImageFilter.FIND_EDGES)).mean[0] / 255
+    if light >= LIGHT_RATIO or edges >= EDGE_DENSITY:
+        return "text"
+    return "photo"
+
+
+def candidates(image, kind):
+    webp = "WebP" in PRESETS
+    if kind == "flat":
+        colors = len(image.getcolors(256))
+        yield PALETTE_PNG, image.convert("P", palette=Image.ADAPTIVE, colors=colors)
+        if webp:
+            yield PRESETS["WebP lossless"], image
+    elif kind == "text":
+        yield (PRESETS["WebP lossless"] if webp else PRESETS["PNG"]), image
+        yield PRESETS["JPEG"], image
+    else:
+        yield PRESETS["JPEG"], image
+        if webp:
+            yield PRESETS["WebP"], image
+
+
+def ssim(a, b, block=8):
+    """
+    Mean SSIM of two images of equal size over non-overlapping blocks, computed
+    on the luma channel with Pillow's C operations.
+    """
+    x = a.convert("L").convert("F")
+    y = b.convert("L").convert("F")
+    size = (max(1, x.width // block), max(1, x.height // block))
+
+    def mean(image):
+        return image.resize(size, Image.BOX)
+
+    mx, my = mean(x), mean(y)
+    mxx = mean(ImageMath.eval("a * a", a=x))
+    myy = mean(ImageMath.eval("a * a", a=y))
+    mxy = mean(ImageMath.eval("a * b", a=x, b=y))
+    ssim_map = ImageMath.eval(
+        "((2 * mx * my + c1) * (2 * (mxy - mx * my) + c2))"
+        " / ((mx * mx + my * my + c1) * (mxx - mx * mx + myy - my * my + c2))",
+        mx=mx, my=my, mxx=mxx, myy=myy, mxy=mxy, c1=SSIM_C1, c2=SSIM_C2)
+    return sum(ssim_map.getdata()) / (size[0] * size[1])
+
+
+def encode_target(image, target, steps):
+    """
+    Binary search the lowest quality whose SSIM against image reaches target,
+    trying at most `steps` encodings.
+    """
+    codec = PRESETS["WebP"] if "WebP" in PRESETS else PRESETS["JPEG"]
+    low, high = 10, 95
+    best = None
+    while steps > 0 and low <= high:
+        quality = (low + high) // 2
+        candidate = codec._replace(options=dict(codec.options, quality=quality))
+        data = save(image, candidate)
+        if ssim(image, Image.open(BytesIO(data))) >= target:
+            best = codec, data
+            high = quality - 1
+        else:
+            low = quality + 1
+        steps -= 1
+    if best is None:
+        best = codec, save(image, codec._replace(options=dict(codec.options, quality=95)))
+    return best
+
+
+def save(image, codec):
+    buffer = BytesIO()
+    image.save(buffer, format=codec.format, **codec.options)
+    return buffer.getvalue()
+
+
+def encode(image, codec):
+    """
+    Encode image with a preset. Returns the codec actually used and the encoded bytes;
+    "Auto" classifies the image and keeps the smallest of the suitable formats,
+    "Target quality" searches the smallest lossy encoding that meets an SSIM target.
+    """
+    if codec.format is not None:
+        return codec, save(image, codec)
+    if codec.name == "Target quality":
+        return encode_target(image, codec.options["ssim"], codec.options["steps"])
+    best = None
+    for candidate, converted in candidates(image, classify(image)):
+        data = save(converted, candidate)
+        if best is None or len(data) < len(best[1]):
+            best = candidate, data
+    return best
@@ -0,0 +1,82 @@
+import functools
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from pdf2image.exceptions import PDFPageCountError
+
+from .poppler import run_poppler
+
+PAGES = re.compile(r"^Pages:\s+(\d+)", re.M)
+PAGE_SIZE = re.compile(r"^Page\s+(\d+) size:\s+([\d.]+) x ([\d.]+)", re.M)
+PAGE_ROT = re.compile(r"^Page\s+(\d+) rot:\s+(\d+)", re.M)
+
+
+def document_key(path):
+    st = os.stat(path)
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+
+def per_document(limit):
+    """
+    Memoize a function of a PDF path for the `limit` most recently used documents,
+    each for as long as the file keeps its path, mtime and size.
+    """
+    def decorate(function):
+        results = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(function)
+        def memoized(path):
+            key = document_key(path)
+            with lock:
+                if key in results:
+                    results.move_to_end(key)
+                    return results[key]
+            result = function(path)
+            with lock:
+                results[key] = result
+                while len(results) > limit:
+                    results.popitem(last=False)
+            return result
+        return memoized
+    return decorate
+
+
+@per_document(16)
+def document_info(path):
+    """
+    pdfinfo results, cached per document.
+    """
+    return pdfinfo(path)
+
+
+def pdfinfo(path, poppler_path=None, timeout=None):
+    """
+    Page count and per-page crop box sizes in points (as displayed, i.e. after rotation)
+    from a single pdfinfo run.
+    """
+    out = run_poppler("pdfinfo", ["-f", "1", "-l", str(2 ** 31 - 1), path], poppler_path, timeout)
+    out = out.decode("utf8", "ignore")
+    pages = PAGES.search(out)
+    if pages is None:
+        raise PDFPageCountError("Unable to get page count.")
+
+    rotation = {int(page): int(rot) for page, rot in PAGE_ROT.findall(out)}
+    sizes = []
+    for page, width, height in PAGE_SIZE.findall(out):
+        width, height = float(width), float(height)
+        if rotation.get(int(page), 0) % 180:
+            width, height = height, width
+        sizes.append((width, height))
+    return {"pages": int(pages.group(1)), "sizes": sizes}
+
+
+def fit_size(page_size, box):
+    """
+    Largest pixel size with the page's aspect ratio that fits into box.
+    """
+    width, height = page_size
+    scale = min(box[0] / width, box[1] / height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
@@ -0,0 +1,129 @@
+from collections import namedtuple
+
+from PIL import Image
+
+Cell = namedtuple("Cell", ["page", "box"])
+
+
+def crop(image, sections, origin=(0, 0), size=None):
+    """
+    Cut a whole grid of normalized sections out of one page image. The cells
+    only reference the page and their pixel box; pixels are copied by cell_image().
+    """
+    width, height = size or image.size
+    rects = [section.getCoords() for section_row in sections for section in section_row]
+    boxes = [(round(x0 * width) - origin[0], round(y0 * height) - origin[1],
+              round(x1 * width) - origin[0], round(y1 * height) - origin[1]) for x0, y0, x1, y1 in rects]
+    cells = iter(Cell(image, box) for box in boxes)
+    return [[next(cells) for _ in section_row] for section_row in sections]
+
+
+def ink_mask(image, threshold=240):
+    """
+    Binary mask (mode "L", 255 = ink) of every pixel darker than threshold.
+    """
+    return image.convert("L").point([255 if v < threshold else 0 for v in range(256)])
+
+
+def trim(grid, padding=0, threshold=240):
+    """
+    Shrink every cell of a grid to the bounding box of its content plus padding.
+    The ink mask is computed once per page and shared by all cells on it.
+    """
+    masks = {}
+    trimmed = []
+    for row in grid:
+        trimmed_row = []
+        for cell in row:
+            if id(cell.page) not in masks:
+                masks[id(cell.page)] = ink_mask(cell.page, threshold)
+            x0, y0, x1, y1 = cell.box
+            bbox = masks[id(cell.page)].crop(cell.box).getbbox()
+            if bbox is not None:
+                cell = cell._replace(box=(max(x0, x0 + bbox[0] - padding), max(y0, y0 + bbox[1] - padding),
+                                          min(x1, x0 + bbox[2] + padding), min(y1, y0 + bbox[3] + padding)))
+            trimmed_row.append(cell)
+        trimmed.append(trimmed_row)
+    return trimmed
+
+
+def blank(cells, max_speck=4, threshold=240):
+    """
+    Flags the cells without content: no ink at all, or only a speck whose
+    bounding box is at most max_speck pixels in both directions. The ink mask
+    is computed once per page and shared by all cells on it.
+    """
+    masks = {}
+    flags = []
+    for cell in cells:
+        if id(cell.page) not in masks:
+            masks[id(cell.page)] = ink_mask(cell.page, threshold)
+        bbox = masks[id(cell.page)].crop(cell.box).getbbox()
+        flags.append(bbox is None or (bbox[2] - bbox[0] <= max_speck and bbox[3] - bbox[1] <= max_speck))
+    return flags
+
+
+def profile(mask, axis):
+    """
+    Mean ink per row (axis 0) or per column (axis 1) of a mask, 0-255.
+    """
+    size = (1, mask.height) if axis == 0 else (mask.width, 1)
+    return list(mask.convert("F").resize(size, Image.BOX).getdata())
+
+
+def gap_lengths(values, ink):
+    """
+    Length of the empty run every position of a profile lies in, 0 where there is ink.
+    """
+    lengths = [0] * len(values)
+    i = 0
+    while i < len(values):
+        if values[i] > ink:
+            i += 1
+            continue
+        j = i
+        while j < len(values) and values[j] <= ink:
+            j += 1
+        lengths[i:j] = [j - i] * (j - i)
+        i = j
+    return lengths
+
+
+def segments(values, min_gap, ink=0, max_count=10):
+    """
+    Content bounds of a profile and the number of equal cells it splits into.
+    For every candidate count the expected gutter positions must fall into
+    gaps of at least min_gap; the highest count whose narrowest such gap is
+    about as wide as the best one found wins.
+    """
+    inked = [i for i, v in enumerate(values) if v > ink]
+    if not inked:
+        return None
+    first, last = inked[0], inked[-1] + 1
+    lengths = gap_lengths(values, ink)
+    best, best_gap = 1, min_gap
+    for count in range(2, max_count + 1):
+        gap = min(lengths[first + k * (last - first) // count] for k in range(1, count))
+        if gap > min_gap and gap >= 0.8 * best_gap:
+            best, best_gap = count, max(gap, best_gap)
+    return (first, last), best
+
+
+def detect_grid(image, min_gap=0.02, threshold=240):
+    """
+    Find a slide grid from the ink projection profiles of a page. Returns the
+    normalized (x0, y0, x1, y1) bounds and the number of rows and columns, or None.
+    """
+    mask = ink_mask(image, threshold)
+    rows = segments(profile(mask, 0), min_gap * mask.height)
+    columns = segments(profile(mask, 1), min_gap * mask.width)
+    if rows is None or columns is None:
+        return None
+    (y0, y1), row_count = rows
+    (x0, x1), column_count = columns
+    bounds = (x0 / mask.width, y0 / mask.height, x1 / mask.width, y1 / mask.height)
+    return bounds, row_count, column_count
+
+
+def cell_image(cell):
+    return cell.page.crop(cell.box)
@@ -0,0 +1,59 @@
+import zlib
+from collections import OrderedDict, namedtuple
+
+from PyQt5.QtGui import QImage, QPixmap
+from PIL import Image
+
+StoredPage = namedtuple("StoredPage", ["width", "height", "data"])
+
+
+def compress(frame):
+    return StoredPage(frame.width, frame.height, zlib.compress(frame.data, 1))
+
+
+class PageStore:
+    """
+    Preview pages kept zlib-compressed within a memory budget, plus a small LRU
+    of decoded pixmaps. When over budget, the pages farthest from the current
+    page are dropped and have to be rendered again.
+    """
+
+    def __init__(self, max_bytes, decoded=5):
+        self.max_bytes = max_bytes
+        self.decoded = decoded
+        self.pages = {}
+        self.pixmaps = OrderedDict()
+        self.total = 0
+
+    def __contains__(self, i):
+        return i in self.pages
+
+    def put(self, i, page, current=0):
+        self.total += len(page.data) - (len(self.pages[i].data) if i in self.pages else 0)
+        self.pages[i] = page
+        self.pixmaps.pop(i, None)
+        while self.total > self.max_bytes and len(self.pages) > 1:
+            farthest = max(self.pages, key=lambda p: abs(p - current))
+            self.discard(farthest)
+
+    def discard(self, i):
+        page = self.pages.pop(i, None)
+        if page is not None:
+            self.total -= len(page.data)
+        self.pixmaps.pop(i, None)
+
+    def image(self, i):
+        page = self.pages[i]
+        return Image.frombytes("RGB", (page.width, page.height), zlib.decompress(page.data))
+
+    def pixmap(self, i):
+        if i in self.pixmaps:
+            self.pixmaps.move_to_end(i)
+            return self.pixmaps[i]
+        page = self.pages[i]
+        data = zlib.decompress(page.data)
+        image = QImage(data, page.width, page.height, 3 * page.width, QImage.Format_RGB888)
+        self.pixmaps[i] = QPixmap.fromImage(image)
+        while len(self.pixmaps) > self.decoded:
+            self.pixmaps.popitem(last=False)
+        return self.pixmaps[i]
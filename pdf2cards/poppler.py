@@ -0,0 +1,33 @@
+import os
+from subprocess import Popen, PIPE, TimeoutExpired
+
+from pdf2image.exceptions import PopplerNotInstalledError, PDFPopplerTimeoutError
+from pdf2image.pdf2image import _get_command_path
+
+
+class PopplerError(Exception):
+    pass
+
+
+def run_poppler(command, args, poppler_path=None, timeout=None):
+    """
+    Run a poppler tool and return its stdout, raising PopplerError with its stderr if it fails.
+    """
+    args = [_get_command_path(command, poppler_path)] + args
+    env = os.environ.copy()
+    if poppler_path is not None:
+        env["LD_LIBRARY_PATH"] = poppler_path + ":" + env.get("LD_LIBRARY_PATH", "")
+    try:
+        proc = Popen(args, env=env, stdout=PIPE, stderr=PIPE)
+    except OSError:
+        raise PopplerNotInstalledError(f"Unable to run {command}. Is poppler installed and in PATH?")
+
+    try:
+        data, err = proc.communicate(timeout=timeout)
+    except TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise PDFPopplerTimeoutError("Run poppler poppler timeout.")
+    if proc.returncode != 0:
+        raise PopplerError(f"{command} failed with exit code {proc.returncode}: {err.decode('utf8', 'ignore').strip()}")
+    return data
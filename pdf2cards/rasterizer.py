@@ -0,0 +1,212 @@
+import shutil
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from PIL import Image
+from pdf2image.pdf2image import _build_command, _get_command_path
+
+from .poppler import run_poppler
+
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
+Frame = namedtuple("Frame", ["width", "height", "data"])
+
+
+class RenderError(Exception):
+    pass
+
+
+def ppm_frames(data):
+    """
+    Split concatenated binary PPM images into frames of raw RGB bytes without copying.
+    """
+    frames = []
+    view = memoryview(data)
+    index = 0
+    while index < len(data):
+        try:
+            code, size, maxval = data[index:index + 40].split(b"\n")[0:3]
+            width, height = (int(v) for v in size.split(b" "))
+        except ValueError:
+            raise RenderError("Malformed PPM header")
+        if code != b"P6" or maxval != b"255":
+            raise RenderError("Unsupported PPM format")
+        start = index + len(code) + len(size) + len(maxval) + 3
+        index = start + width * height * 3
+        if index > len(data):
+            raise RenderError("Truncated PPM data")
+        frames.append(Frame(width, height, view[start:index]))
+    return frames
+
+
+def render_ppm(path, first_page, last_page, dpi=None, size=None, region=None, poppler_path=None, timeout=None):
+    """
+    Rasterize a page range with pdftoppm, reading PPM from its stdout. Like every
+    backend it renders the crop box, the page size pdfinfo reports.
+    """
+    args = ["-r", str(dpi), path] if dpi else [path]
+    args = _build_command(args, None, first_page, last_page, "ppm", None, None,
+                          None, True, False, False, False, size, region)
+    frames = ppm_frames(run_poppler("pdftoppm", args, poppler_path, timeout))
+    if len(frames) != last_page - first_page + 1:
+        raise RenderError(f"pdftoppm returned {len(frames)} pages for pages {first_page}-{last_page}")
+    return frames
+
+
+class Rasterizer:
+    """
+    Renders pages (1-based, inclusive range) to raw RGB frames. Concurrent
+    backends can serve several render threads at once.
+    """
+    name = None
+    concurrent = True
+
+    @classmethod
+    def available(cls):
+        return False
+
+    def render(self, path, first_page, last_page, dpi=None, size=None, region=None):
+        raise NotImplementedError
+
+    def close(self, path):
+        pass
+
+
+class PdftoppmRasterizer(Rasterizer):
+    name = "pdftoppm"
+
+    def __init__(self, poppler_path=None):
+        self.poppler_path = poppler_path
+
+    @classmethod
+    def available(cls):
+        return shutil.which(_get_command_path("pdftoppm")) is not None
+
+    def render(self, path, first_page, last_page, dpi=None, size=None, region=None):
+        return render_ppm(path, first_page, last_page, dpi, size, region, self.poppler_path)
+
+
+class PdftocairoRasterizer(Rasterizer):
+    name = "pdftocairo"
+
+    def __init__(self, poppler_path=None):
+        self.poppler_path = poppler_path
+
+    @classmethod
+    def available(cls):
+        return shutil.which(_get_command_path("pdftocairo")) is not None
+
+    def render(self, path, first_page, last_page, dpi=None, size=None, region=None):
+        # pdftocairo can only write a single page to stdout
+        frames = []
+        for page in range(first_page, last_page + 1):
+            args = ["-r", str(dpi), path] if dpi else [path]
+            args = _build_command(args, None, page, page, "png", None, None,
+                                  None, True, False, True, False, size, region) + ["-"]
+            image = Image.open(BytesIO(run_poppler("pdftocairo", args, self.poppler_path))).convert("RGB")
+            frames.append(Frame(image.width, image.height, image.tobytes()))
+        return frames
+
+
+class FitzRasterizer(Rasterizer):
+    """
+    In-process rendering with PyMuPDF, if it is installed. Documents stay open
+    between calls; MuPDF is not thread safe, so renders are serialized.
+    """
+    name = "fitz"
+    concurrent = False
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.documents = {}
+        self.closed = set()
+
+    @classmethod
+    def available(cls):
+        return fitz is not None
+
+    def render(self, path, first_page, last_page, dpi=None, size=None, region=None):
+        frames = []
+        with self.lock:
+            if path in self.closed:
+                raise RenderError("Document was closed")
+            if path not in self.documents:
+                self.documents[path] = fitz.open(path)
+            document = self.documents[path]
+            for page in range(first_page - 1, last_page):
+                page = document[page]
+                rect = page.rect
+                if size is not None:
+                    zoom_x, zoom_y = size[0] / rect.width, size[1] / rect.height
+                else:
+                    zoom_x = zoom_y = (dpi or 150) / 72
+                clip = None
+                if region is not None:
+                    x, y, width, height = region
+                    clip = fitz.Rect(x / zoom_x, y / zoom_y, (x + width) / zoom_x, (y + height) / zoom_y)
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom_x, zoom_y), clip=clip, alpha=False)
+                frames.append(Frame(pix.width, pix.height, pix.samples))
+        return frames
+
+    def close(self, path):
+        with self.lock:
+            self.closed.add(path)
+            document = self.documents.pop(path, None)
+            if document is not None:
+                document.close()
+
+
+BACKENDS = [PdftoppmRasterizer, PdftocairoRasterizer, FitzRasterizer]
+selected = {}
+
+
+def select_rasterizer(path, size, workers=1, page=1):
+    """
+    Benchmark every available backend on one page of the document and return the
+    fastest with the page it rendered (None if the choice was already made).
+    The backends run side by side, so this takes about as long as the slowest
+    one. Serialized backends only get one of the `workers` render threads at a
+    time, so their time counts `workers` times.
+    """
+    if path in selected:
+        return selected[path], None
+
+    def benchmark(backend):
+        rasterizer = backend()
+        start = time.perf_counter()
+        try:
+            frame = rasterizer.render(path, page, page, size=size)[0]
+        except Exception:
+            return None
+        elapsed = time.perf_counter() - start
+        return elapsed * (1 if backend.concurrent else workers), rasterizer, frame
+
+    backends = [backend for backend in BACKENDS if backend.available()]
+    results = []
+    if backends:
+        with ThreadPoolExecutor(len(backends)) as pool:
+            results = [result for result in pool.map(benchmark, backends) if result is not None]
+    if not results:
+        selected[path] = PdftoppmRasterizer()
+        return selected[path], None
+    _, rasterizer, frame = min(results, key=lambda result: result[0])
+    for _, loser, _ in results:
+        if loser is not rasterizer:
+            loser.close(path)
+    selected[path] = rasterizer
+    return rasterizer, frame
+
+
+def release_rasterizer(path):
+    """
+    Forget the backend chosen for a document and let it close the file.
+    """
+    rasterizer = selected.pop(path, None)
+    if rasterizer is not None:
+        rasterizer.close(path)
@@ -0,0 +1,177 @@
+import heapq
+import itertools
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class RenderQueue:
+    """
+    Hands out pages to a pool of render threads, urgent pages first.
+    """
+
+    def __init__(self, render, done, failed, workers=None, batch=2):
+        self.render = render
+        self.done = done
+        self.failed = failed
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.batch = batch
+        self.cond = threading.Condition()
+        self.report_lock = threading.Lock()
+        self.counter = itertools.count()
+        self.heap = []
+        self.taken = set()
+        self.urgent = set()
+        self.results = {}
+        self.reported = set()
+        self.next_report = 0
+        self.page_count = 0
+        self.closed = False
+        self.threads = [threading.Thread(target=self.run, daemon=True) for _ in range(self.workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def sweep(self, page_count):
+        """
+        Queue every page of the document in order, behind any urgent page.
+        """
+        with self.cond:
+            self.page_count = page_count
+            for page in range(page_count):
+                heapq.heappush(self.heap, (1, next(self.counter), page))
+            self.cond.notify_all()
+
+    def put(self, page, urgent=True):
+        with self.cond:
+            if page in self.reported:
+                if not urgent:
+                    return
+                self.reported.discard(page)
+                self.taken.discard(page)
+            if urgent:
+                self.urgent.add(page)
+            if page not in self.taken:
+                heapq.heappush(self.heap, (0 if urgent else 1, next(self.counter), page))
+                self.cond.notify()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.heap = []
+            self.cond.notify_all()
+
+    def take(self):
+        with self.cond:
+            while not self.closed:
+                while self.heap and self.heap[0][2] in self.taken:
+                    heapq.heappop(self.heap)
+                if self.heap:
+                    break
+                self.cond.wait()
+            if self.closed:
+                return None
+            priority, _, first = heapq.heappop(self.heap)
+            last = first
+            while last - first + 1 < self.batch and self.heap:
+                top = self.heap[0]
+                if top[2] in self.taken:
+                    heapq.heappop(self.heap)
+                elif top[0] == priority and top[2] == last + 1:
+                    heapq.heappop(self.heap)
+                    last += 1
+                else:
+                    break
+            self.taken.update(range(first, last + 1))
+            return first, last
+
+    def run(self):
+        while True:
+            pages = self.take()
+            if pages is None:
+                return
+            first, last = pages
+            try:
+                results = list(self.render(first, last))
+                if len(results) != last - first + 1:
+                    raise RuntimeError(f"Got {len(results)} pages for pages {first + 1}-{last + 1}")
+            except Exception as e:
+                self.finish({}, range(first, last + 1), e)
+                continue
+            self.finish(dict(zip(range(first, last + 1), results)))
+
+    def finish(self, results, failed=(), error=None):
+        """
+        Report finished pages. Urgent pages are reported right away, all others
+        strictly in page order. Failed pages are reported with the error right
+        away and count as done for the sweep; an urgent put renders them again.
+        """
+        with self.report_lock:
+            with self.cond:
+                if self.closed:
+                    return
+                self.results.update(results)
+                self.reported.update(failed)
+                self.urgent.difference_update(failed)
+                ready = [p for p in self.results if p in self.urgent]
+                self.reported.update(ready)
+                while self.next_report < self.page_count and (self.next_report in self.reported
+                                                              or self.next_report in self.results):
+                    if self.next_report not in self.reported:
+                        ready.append(self.next_report)
+                        self.reported.add(self.next_report)
+                    self.next_report += 1
+            for page in failed:
+                self.failed(page, error)
+            for page in ready:
+                self.done(page, self.results.pop(page))
+
+
+class Prefetcher:
+    """
+    Renders a bounded number of pages ahead of time. Pages that are no longer
+    wanted are cancelled if they have not started yet; finished pages are kept
+    until more than `keep` pages are held.
+    """
+
+    def __init__(self, render, limit=2, keep=4):
+        self.render = render
+        self.limit = limit
+        self.keep = keep
+        self.pool = ThreadPoolExecutor(limit)
+        self.futures = OrderedDict()
+        self.lock = threading.Lock()
+
+    def prefetch(self, pages):
+        pages = pages[:self.limit]
+        with self.lock:
+            for page in list(self.futures):
+                if page not in pages and self.futures[page].cancel():
+                    del self.futures[page]
+            for page in pages:
+                if page not in self.futures:
+                    self.futures[page] = self.pool.submit(self.render, page)
+                self.futures.move_to_end(page)
+            while len(self.futures) > self.keep:
+                self.futures.popitem(last=False)[1].cancel()
+
+    def take(self, page):
+        """
+        The prefetched result for page, or None if it was never requested or has not started.
+        """
+        with self.lock:
+            future = self.futures.get(page)
+            if future is None or future.cancel():
+                self.futures.pop(page, None)
+                return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def close(self):
+        with self.lock:
+            for future in self.futures.values():
+                future.cancel()
+            self.futures.clear()
+        self.pool.shutdown(wait=False)
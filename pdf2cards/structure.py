@@ -0,0 +1,137 @@
+import threading
+
+from PyQt5.QtCore import QRectF
+
+from pypdf import PdfReader
+from pypdf.generic import ContentStream
+
+# placed forms smaller than this share of the page are logos or decorations, not slides
+MIN_AREA = 0.02
+
+def multiply(m, n):
+    return (m[0] * n[0] + m[1] * n[2], m[0] * n[1] + m[1] * n[3],
+            m[2] * n[0] + m[3] * n[2], m[2] * n[1] + m[3] * n[3],
+            m[4] * n[0] + m[5] * n[2] + n[4], m[4] * n[1] + m[5] * n[3] + n[5])
+
+
+def transform(box, matrix):
+    x0, y0, x1, y1 = box
+    points = [(x * matrix[0] + y * matrix[2] + matrix[4], x * matrix[1] + y * matrix[3] + matrix[5])
+              for x, y in ((x0, y0), (x1, y0), (x0, y1), (x1, y1))]
+    xs, ys = [p[0] for p in points], [p[1] for p in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def placements(reader, page):
+    """
+    Boxes, in default user space, of the Form XObjects drawn directly by a page's content stream.
+    """
+    pdf_page = reader.pages[page]
+    resources = pdf_page.get("/Resources")
+    xobjects = resources.get_object().get("/XObject") if resources is not None else None
+    if xobjects is None:
+        return []
+    xobjects = xobjects.get_object()
+    contents = pdf_page.get_contents()
+    if contents is None:
+        return []
+
+    boxes = []
+    ctm = (1, 0, 0, 1, 0, 0)
+    stack = []
+    for operands, operator in ContentStream(contents, reader).operations:
+        if operator == b"q":
+            stack.append(ctm)
+        elif operator == b"Q" and stack:
+            ctm = stack.pop()
+        elif operator == b"cm":
+            ctm = multiply(tuple(float(v) for v in operands), ctm)
+        elif operator == b"Do" and operands[0] in xobjects:
+            xobject = xobjects[operands[0]].get_object()
+            if xobject.get("/Subtype") != "/Form":
+                continue
+            matrix = tuple(float(v) for v in xobject.get("/Matrix", (1, 0, 0, 1, 0, 0)))
+            boxes.append(transform(tuple(float(v) for v in xobject["/BBox"]), multiply(matrix, ctm)))
+    return boxes
+
+
+def grid_from_boxes(boxes, page_box):
+    """
+    Arrange placement boxes into rows of normalized QRectF, top to bottom and
+    left to right, or None unless they form a regular grid.
+    """
+    left, bottom, right, top = page_box
+    width, height = right - left, top - bottom
+    rects = [((x0 - left) / width, (top - y1) / height, (x1 - left) / width, (top - y0) / height)
+             for x0, y0, x1, y1 in boxes]
+    rects = [r for r in rects if (r[2] - r[0]) * (r[3] - r[1]) >= MIN_AREA]
+    if len(rects) < 2:
+        return None
+
+    rows = []
+    for rect in sorted(rects, key=lambda r: r[1]):
+        if rows and rect[1] < rows[-1][0][3]:
+            rows[-1].append(rect)
+        else:
+            rows.append([rect])
+    if len({len(row) for row in rows}) != 1:
+        return None
+    return [[QRectF(x0, y0, x1 - x0, y1 - y0) for x0, y0, x1, y1 in sorted(row)] for row in rows]
+
+
+class PageStructure:
+    """
+    Cell rectangles of the pages of one document, read from where each page's
+    content stream places Form XObjects, in the format of
+    GraphicsRectItem.getSections. The file is parsed from disk on demand and
+    only the computed sections are kept; close() releases it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.reader = None
+        self.sections = {}
+        self.lock = threading.Lock()
+
+    def page_sections(self, page):
+        """
+        Sections of a page, or None if it is not a regular n-up layout.
+        """
+        with self.lock:
+            if page not in self.sections:
+                self.sections[page] = self.read(page)
+            return self.sections[page]
+
+    def read(self, page):
+        try:
+            if self.file is None:
+                self.file = open(self.path, "rb")
+            if self.reader is None:
+                self.reader = PdfReader(self.file)
+            pdf_page = self.reader.pages[page]
+            if pdf_page.get("/Rotate", 0) % 360:
+                return None
+            # poppler renders the crop box, so normalize against it
+            page_box = tuple(float(v) for v in pdf_page.cropbox)
+            return grid_from_boxes(placements(self.reader, page), page_box)
+        except Exception:
+            return None
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+            self.file = None
+            self.reader = None
+
+
+def grid_bounds(sections):
+    """
+    Normalized (x0, y0, x1, y1) bounds of a grid of sections and its number of
+    rows and columns, in the format returned by imaging.detect_grid.
+    """
+    rects = [section for row in sections for section in row]
+    bounds = (min(r.left() for r in rects), min(r.top() for r in rects),
+              max(r.right() for r in rects), max(r.bottom() for r in rects))
+    return bounds, len(sections), len(sections[0])
@@ -0,0 +1,102 @@
+import html
+import xml.etree.ElementTree as ElementTree
+from io import BytesIO
+
+from pdf2image.exceptions import PopplerNotInstalledError, PDFPopplerTimeoutError
+
+from .document import document_info, per_document
+from .poppler import PopplerError, run_poppler
+
+# the spatial index splits every page into BUCKETS x BUCKETS cells
+BUCKETS = 16
+
+
+class TextPage:
+    """
+    Words of one page with normalized centres, bucketed by position for fast
+    lookup of the words inside a rectangle.
+    """
+
+    def __init__(self, words):
+        self.words = words
+        self.buckets = {}
+        for i, (x, y, _, _) in enumerate(words):
+            self.buckets.setdefault(self.bucket(x, y), []).append(i)
+
+    @staticmethod
+    def bucket(x, y):
+        return min(max(int(x * BUCKETS), 0), BUCKETS - 1), min(max(int(y * BUCKETS), 0), BUCKETS - 1)
+
+    def html(self, rect):
+        """
+        Words whose centre lies in a normalized QRectF, as HTML with one line per
+        text line, or None if there are none.
+        """
+        x0, y0, x1, y1 = rect.getCoords()
+        (bx0, by0), (bx1, by1) = self.bucket(x0, y0), self.bucket(x1, y1)
+        found = sorted(i for bx in range(bx0, bx1 + 1) for by in range(by0, by1 + 1)
+                       for i in self.buckets.get((bx, by), ())
+                       if x0 <= self.words[i][0] < x1 and y0 <= self.words[i][1] < y1)
+        if not found:
+            return None
+        lines = []
+        line = None
+        for i in found:
+            _, _, line_id, text = self.words[i]
+            if line_id != line:
+                lines.append([])
+                line = line_id
+            lines[-1].append(html.escape(text, quote=False))
+        return "<br>".join(" ".join(words) for words in lines)
+
+
+@per_document(2)
+def document_text(path):
+    """
+    Text layer of every page, from one pdftotext run cached per document.
+    """
+    return pdftotext(path, document_info(path)["sizes"])
+
+
+def pdftotext(path, sizes, poppler_path=None, timeout=None):
+    """
+    Words of all pages from `pdftotext -bbox-layout`, as TextPages. Returns an
+    empty list if pdftotext is missing or fails, so that cards fall back to images.
+    """
+    try:
+        out = run_poppler("pdftotext", ["-bbox-layout", "-cropbox", "-enc", "UTF-8", path, "-"], poppler_path, timeout)
+        return parse_bbox_layout(out, sizes)
+    except (PopplerError, PopplerNotInstalledError, PDFPopplerTimeoutError, ElementTree.ParseError):
+        return []
+
+
+def parse_bbox_layout(data, sizes):
+    """
+    Parse pdftotext's XHTML. Word boxes are in displayed (rotated) page space,
+    but <page> carries the unrotated size, so centres are normalized by `sizes`,
+    the displayed page sizes from pdfinfo.
+    """
+    pages = []
+    words = []
+    width = height = 1
+    line = 0
+    for event, element in ElementTree.iterparse(BytesIO(data), events=("start", "end")):
+        tag = element.tag.rsplit("}", 1)[-1]
+        if event == "start":
+            if tag == "page":
+                if len(pages) < len(sizes):
+                    width, height = sizes[len(pages)]
+                else:
+                    width, height = float(element.get("width")), float(element.get("height"))
+                words = []
+            elif tag == "line":
+                line += 1
+        elif tag == "word":
+            x = (float(element.get("xMin")) + float(element.get("xMax"))) / 2 / width
+            y = (float(element.get("yMin")) + float(element.get("yMax"))) / 2 / height
+            words.append((x, y, line, element.text or ""))
+            element.clear()
+        elif tag == "page":
+            pages.append(TextPage(words))
+            element.clear()
+    return pages
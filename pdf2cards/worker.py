@@ -1,9 +1,19 @@
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, Qt, QSize
-from PyQt5.QtGui import QPixmap
-from pdf2image import convert_from_path
-import tempfile
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QSize
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .GenAnki import writeCards
+from .cache import PageCache, document_digest
+from .codec import encode, get_codec
+from .document import document_info, fit_size
+from .imaging import blank, crop, cell_image, trim
+from .pagestore import compress
+from .rasterizer import release_rasterizer, select_rasterizer
+from .scheduler import Prefetcher, RenderQueue
+from .structure import PageStructure
+from .textlayer import document_text
+import hashlib
+import math
 import os
 
 
@@ -16,46 +26,248 @@ def sort_pictures(questions, answers):
     return cards
 
 
-def crop(image, sections):
-    images = []
-    for section_row in sections:
-        row = []
-        for section in section_row:
-            coords = section.getCoords()
-            coords = (coords[0]*image.width, coords[1]*image.height, coords[2]*image.width, coords[3]*image.height)
-            row.append(image.crop(coords))
-        images.append(row)
-    return images
+def encode_cell(job):
+    cell, codec = job
+    codec, data = encode(cell_image(cell), codec)
+    return f"{hashlib.sha1(data).hexdigest()}.{codec.extension}", data, codec.name
+
+
+def bounds(sections):
+    coords = [section.getCoords() for section_row in sections for section in section_row]
+    return (min(c[0] for c in coords), min(c[1] for c in coords),
+            max(c[2] for c in coords), max(c[3] for c in coords))
+
+
+def pixel_window(page_size, dpi, section_bounds):
+    width = math.ceil(page_size[0] * dpi / 72)
+    height = math.ceil(page_size[1] * dpi / 72)
+    x0 = min(max(math.floor(section_bounds[0] * width), 0), width - 1)
+    y0 = min(max(math.floor(section_bounds[1] * height), 0), height - 1)
+    x1 = max(min(math.ceil(section_bounds[2] * width), width), x0 + 1)
+    y1 = max(min(math.ceil(section_bounds[3] * height), height), y0 + 1)
+    return (width, height), (x0, y0, x1 - x0, y1 - y0)
 
 
 class Worker(QObject):
-    converted = pyqtSignal(list)
-    saved = pyqtSignal()
+    opened = pyqtSignal(int)
+    pageReady = pyqtSignal(int, object)
+    pageFailed = pyqtSignal(int, str)
+    sectionsReady = pyqtSignal(int, object)
+    progress = pyqtSignal(int, int)
+    saved = pyqtSignal(object, int)
+    saveFailed = pyqtSignal(str)
 
-    @pyqtSlot()
-    def convertPdf(self, filename, path, scale=QSize(870, 1100)):
-        paths = convert_from_path(filename, dpi=100, output_folder=path, fmt="jpeg", paths_only=True)
-        pixmaps = []
-        for p in paths:
-            pix = QPixmap(p)
-            pixmaps.append(pix.scaled(scale, Qt.IgnoreAspectRatio, Qt.FastTransformation))
-        self.converted.emit(pixmaps)
+    def __init__(self, cache, media_index, scale=QSize(870, 1100), workers=None, encoders=None, target=None,
+                 trim_padding=None, skip_blank=True):
+        super(Worker, self).__init__()
+        self.cache = cache
+        self.media_index = media_index
+        self.scale = scale
+        self.filename = None
+        self.digest = None
+        self.rasterizer = None
+        self.structure = None
+        self.page_count = 0
+        self.page_sizes = []
+        self.sizes = []
+        self.rendered = set()
+        self.queue = RenderQueue(self.renderRange, self.pageDone, self.pageError, workers)
+        self.prefetcher = Prefetcher(self.renderFull)
+        self.encoder = ThreadPoolExecutor(encoders or os.cpu_count())
+        self.target = target
+        self.trim_padding = trim_padding
+        self.skip_blank = skip_blank
+
+    @pyqtSlot(str)
+    def openPdf(self, filename):
+        self.filename = filename
+        self.digest = document_digest(filename)
+        self.structure = PageStructure(filename)
+        info = document_info(filename)
+        self.page_count = info["pages"]
+        self.page_sizes = info["sizes"]
+        self.sizes = [fit_size(size, (self.scale.width(), self.scale.height())) for size in info["sizes"]]
+        self.rasterizer, frame = select_rasterizer(filename, self.sizes[0], self.queue.workers)
+        if frame is not None:
+            self.cache.put(self.cacheKey(0, self.sizes[0]), frame)
+        self.opened.emit(self.page_count)
+        self.queue.put(0)
+        self.queue.sweep(self.page_count)
+
+    @pyqtSlot(int)
+    def renderPage(self, i):
+        if 0 <= i < self.page_count:
+            self.queue.put(i)
+
+    @pyqtSlot(int)
+    def findSections(self, i):
+        if 0 <= i < self.page_count:
+            self.sectionsReady.emit(i, self.structure.page_sections(i))
+
+    def renderRange(self, first, last):
+        frames = {}
+        for i in range(first, last + 1):
+            frame = self.cache.get(self.cacheKey(i, self.sizes[i]))
+            if frame is not None:
+                frames[i] = frame
+
+        i = first
+        while i <= last:
+            if i in frames:
+                i += 1
+                continue
+            end = i
+            while end < last and end + 1 not in frames and self.sizes[end + 1] == self.sizes[i]:
+                end += 1
+            for j, frame in enumerate(self.rasterizer.render(self.filename, i + 1, end + 1, size=self.sizes[i]), i):
+                frames[j] = frame
+                self.cache.put(self.cacheKey(j, self.sizes[j]), frame)
+            i = end + 1
+
+        return [compress(frames[i]) for i in range(first, last + 1)]
+
+    @pyqtSlot(int)
+    def prefetchPage(self, i):
+        if 0 <= i < self.page_count:
+            self.prefetcher.prefetch([i, (i + 1) % self.page_count])
+
+    def renderFull(self, page, dpi=200):
+        key = self.cacheKey(page, (dpi, None))
+        frame = self.cache.get(key)
+        if frame is None:
+            frame = self.rasterizer.render(self.filename, page + 1, page + 1, dpi=dpi)[0]
+            self.cache.put(key, frame)
+        return frame
+
+    def renderHighRes(self, requests, dpi=200):
+        pages = {}
+        for page, sections in requests:
+            pages.setdefault(page, []).append(bounds(sections))
+        windows = {}
+        frames = {}
+        for page, page_bounds in pages.items():
+            section_bounds = (min(b[0] for b in page_bounds), min(b[1] for b in page_bounds),
+                              max(b[2] for b in page_bounds), max(b[3] for b in page_bounds))
+            windows[page] = pixel_window(self.page_sizes[page], dpi, section_bounds)
+            frame = self.cache.get(self.cacheKey(page, (dpi, windows[page][1])))
+            if frame is None:
+                frame = self.cache.get(self.cacheKey(page, (dpi, None))) or self.prefetcher.take(page)
+                if frame is not None:
+                    windows[page] = ((frame.width, frame.height), (0, 0, frame.width, frame.height))
+            if frame is not None:
+                frames[page] = frame
+
+        groups = []
+        for page in sorted(set(pages) - set(frames)):
+            if groups and groups[-1][-1] == page - 1 and self.page_sizes[page] == self.page_sizes[page - 1]:
+                groups[-1].append(page)
+            else:
+                groups.append([page])
+        for group in groups:
+            x0 = min(windows[p][1][0] for p in group)
+            y0 = min(windows[p][1][1] for p in group)
+            x1 = max(windows[p][1][0] + windows[p][1][2] for p in group)
+            y1 = max(windows[p][1][1] + windows[p][1][3] for p in group)
+            for p in group:
+                windows[p] = (windows[p][0], (x0, y0, x1 - x0, y1 - y0))
+
+        def render(group):
+            return self.rasterizer.render(self.filename, group[0] + 1, group[-1] + 1, dpi=dpi,
+                                          region=windows[group[0]][1])
+
+        if groups:
+            with ThreadPoolExecutor(len(groups)) as pool:
+                for group, rendered in zip(groups, pool.map(render, groups)):
+                    for page, frame in zip(group, rendered):
+                        frames[page] = frame
+                        self.cache.put(self.cacheKey(page, (dpi, windows[page][1])), frames[page])
+
+        results = []
+        for page, sections in requests:
+            frame = frames[page]
+            size, region = windows[page]
+            image = Image.frombuffer("RGB", (frame.width, frame.height), frame.data, "raw", "RGB", 0, 1)
+            results.append(crop(image, sections, region[:2], size))
+        return results
+
+    def cacheKey(self, page, resolution):
+        return PageCache.key(self.digest, page, resolution, self.rasterizer.name)
+
+    def pageDone(self, i, page):
+        self.rendered.add(i)
+        self.pageReady.emit(i, page)
+        self.progress.emit(len(self.rendered), self.page_count)
+
+    def pageError(self, i, error):
+        self.pageFailed.emit(i, str(error) or type(error).__name__)
 
     @pyqtSlot()
-    def saveCards(self, path, data, deck):
+    def finish(self):
+        self.thread().quit()
+
+    def close(self):
+        if self.structure is not None:
+            self.structure.close()
+        self.queue.close()
+        self.prefetcher.close()
+        self.encoder.shutdown(wait=False)
+        if self.filename is not None:
+            release_rasterizer(self.filename)
+
+    @pyqtSlot(str, object, object, str)
+    def saveCards(self, path, data, deck, codec):
+        try:
+            report, skipped = self.makeCards(path, data, deck, codec)
+        except Exception as e:
+            self.saveFailed.emit(str(e) or type(e).__name__)
+            return
+        self.saved.emit(report, skipped)
+
+    def makeCards(self, path, data, deck, codec):
+        """
+        Render, encode and add the cards of one question/answer page pair.
+        Returns the per-format report and the number of skipped blank cells.
+        """
         ((q_page, q_sec), (a_page, a_sec)) = data
-        q_img = convert_from_path(path, dpi=200, fmt="jpeg", first_page=q_page + 1, last_page=q_page + 1)[0]
-        a_img = convert_from_path(path, dpi=200, fmt="jpeg", first_page=a_page + 1, last_page=a_page + 1)[0]
-        cards = sort_pictures(crop(q_img, q_sec), crop(a_img, a_sec))
-
-        filename = os.path.splitext(os.path.basename(path))[0]
-        with tempfile.TemporaryDirectory() as tempdir:
-            for i, card in enumerate(cards):
-                fp_front = os.path.join(tempdir, f"{filename}_{q_page}_{i}.jpg")
-                fp_back = os.path.join(tempdir, f"{filename}_{a_page}_{i}.jpg")
-                card[0].save(fp_front, format="JPEG")
-                card[1].save(fp_back, format="JPEG")
-                cards[i] = (fp_front, fp_back)
-            writeCards(cards, deck)
-
-        self.saved.emit()
+        grids = self.renderHighRes([(q_page, q_sec), (a_page, a_sec)])
+        if self.trim_padding is not None:
+            grids = [trim(grid, self.trim_padding) for grid in grids]
+        cards = sort_pictures(*grids)
+        rects = sort_pictures([list(row) for row in q_sec], [list(row) for row in a_sec])
+        skipped = 0
+        if self.skip_blank:
+            flags = blank([question for question, _ in cards])
+            skipped = sum(flags)
+            cards = [card for card, empty in zip(cards, flags) if not empty]
+            rects = [rect for rect, empty in zip(rects, flags) if not empty]
+
+        codec = get_codec(codec)
+        if codec.name == "Target quality" and self.target:
+            codec = codec._replace(options=self.target)
+        texts = [None] * (2 * len(cards))
+        if codec.name == "Text":
+            pages = document_text(path)
+            texts = [pages[page].html(rect) if page < len(pages) else None
+                     for q_rect, a_rect in rects for page, rect in ((q_page, q_rect), (a_page, a_rect))]
+            codec = get_codec("Auto")
+        jobs = []
+        for card in cards:
+            jobs.append((card[0], codec))
+            jobs.append((card[1], codec))
+        jobs = [job for job, text in zip(jobs, texts) if text is None]
+        results = iter(self.encoder.map(encode_cell, jobs))
+        sides = []
+        for text in texts:
+            if text is None:
+                name, data, codec_name = next(results)
+                sides.append(((name, data), codec_name, len(data)))
+            else:
+                sides.append((text, "Text", len(text.encode())))
+        fields = [field for field, _, _ in sides]
+        writeCards(list(zip(fields[0::2], fields[1::2])), deck, self.media_index)
+
+        report = {}
+        for _, name, size in sides:
+            count, total = report.get(name, (0, 0))
+            report[name] = (count + 1, total + size)
+        return report, skipped